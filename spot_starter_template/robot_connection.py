@@ -7,20 +7,28 @@ with a Spot robot using the Boston Dynamics SDK.
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import bosdyn.client
 import bosdyn.client.util
 from bosdyn.client import create_standard_sdk
+from bosdyn.client.auth import InvalidLoginError
+from bosdyn.client.exceptions import ResponseError, RpcError
 from bosdyn.client.robot_command import RobotCommandClient
 from bosdyn.client.robot_state import RobotStateClient
 from bosdyn.client.lease import LeaseClient, LeaseKeepAlive
 from bosdyn.client.estop import EstopClient
-from bosdyn.client.power import PowerClient
+from bosdyn.client.power import CommandTimedOutError, PowerClient
+from bosdyn.client.time_sync import TimedOutError
 
 
 class SpotRobotConnection:
     """Manages connection, authentication, and basic control of a Spot robot."""
 
+    # Loggers cached by client name; creating many connections with the same
+    # name then skips repeated logging-manager lookups and lock acquisitions
+    _loggers = {}
+
     def __init__(self, hostname, client_name='SpotClient', verbose=False):
         """Initialize robot connection parameters.
         
@@ -35,7 +43,11 @@ class SpotRobotConnection:
         
         # Setup logging
         bosdyn.client.util.setup_logging(verbose)
-        self.logger = logging.getLogger(client_name)
+        logger = self._loggers.get(client_name)
+        if logger is None:
+            logger = logging.getLogger(client_name)
+            self._loggers[client_name] = logger
+        self.logger = logger
         
         # Initialize SDK and robot objects
         self.sdk = None
@@ -45,93 +57,121 @@ class SpotRobotConnection:
         self.robot_command_client = None
         self.robot_state_client = None
         self.power_client = None
-        
+
+        # Cache of service clients keyed by service name, so repeat lookups
+        # reuse the same client (and its underlying gRPC channel)
+        self._client_cache = {}
+
     def connect(self):
         """Create SDK and robot objects, establish connection.
-        
-        Raises:
-            Exception: If connection fails
+
+        Returns:
+            bool: True if successful
         """
+        self.logger.info('Connecting to robot at %s...', self.hostname)
+
+        self.sdk = create_standard_sdk(self.client_name)
         try:
-            self.logger.info(f'Connecting to robot at {self.hostname}...')
-            
-            # Create SDK and robot
-            self.sdk = create_standard_sdk(self.client_name)
             self.robot = self.sdk.create_robot(self.hostname)
-            
-            self.logger.info('Connection established.')
-            return True
-        except Exception as e:
-            self.logger.error(f'Failed to connect: {e}')
+        except RpcError as e:
+            self.logger.error('Failed to connect: %s', e)
             return False
-    
+        return True
+
+    def _ensure_client(self, service_name):
+        """Get a service client, reusing a cached instance when available.
+
+        Args:
+            service_name: Name of the service to get a client for
+
+        Returns:
+            The service client instance
+        """
+        client = self._client_cache.get(service_name)
+        if client is None:
+            client = self.robot.ensure_client(service_name)
+            self._client_cache[service_name] = client
+        return client
+
     def authenticate(self, username='admin', password='password'):
         """Authenticate to the robot.
-        
+
         Args:
             username: Robot username (default: 'admin')
             password: Robot password (default: 'password')
-        
-        Raises:
-            Exception: If authentication fails
+
+        Returns:
+            bool: True if successful
         """
+        self.logger.info('Authenticating with robot...')
+
+        # Try authentication with provided credentials
         try:
-            self.logger.info('Authenticating with robot...')
-            
-            # Try authentication with provided credentials
-            try:
-                self.robot.authenticate(username, password)
-            except bosdyn.client.auth.InvalidLoginError:
-                # Fall back to interactive prompt if credentials fail
-                self.logger.warning('Credentials failed, using interactive login...')
-                bosdyn.client.util.authenticate(self.robot)
-            
-            self.logger.info('Authentication successful.')
-            return True
-        except Exception as e:
-            self.logger.error(f'Authentication failed: {e}')
+            self.robot.authenticate(username, password)
+        except InvalidLoginError:
+            # Fall back to interactive prompt if credentials fail
+            self.logger.warning('Credentials failed, using interactive login...')
+            bosdyn.client.util.authenticate(self.robot)
+        except (RpcError, ResponseError) as e:
+            self.logger.error('Authentication failed: %s', e)
             return False
+
+        self.logger.info('Authentication successful.')
+        return True
     
     def setup_clients(self):
         """Initialize necessary service clients.
-        
-        Raises:
-            Exception: If client setup fails
+
+        Returns:
+            bool: True if successful
         """
+        self.logger.info('Setting up service clients...')
+
+        # Create the clients concurrently; each ensure_client call blocks on
+        # its own RPC round-trip, so overlapping them costs roughly one
+        # round-trip instead of four. The lease client is submitted first
+        # since lease acquisition is the next step in the startup sequence.
         try:
-            self.logger.info('Setting up service clients...')
-            
-            # Get essential clients
-            self.lease_client = self.robot.ensure_client(
-                LeaseClient.default_service_name)
-            self.robot_command_client = self.robot.ensure_client(
-                RobotCommandClient.default_service_name)
-            self.robot_state_client = self.robot.ensure_client(
-                RobotStateClient.default_service_name)
-            self.power_client = self.robot.ensure_client(
-                PowerClient.default_service_name)
-            
-            self.logger.info('Clients ready.')
-            return True
-        except Exception as e:
-            self.logger.error(f'Failed to setup clients: {e}')
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                lease_future = executor.submit(
+                    self._ensure_client, LeaseClient.default_service_name)
+                command_future = executor.submit(
+                    self._ensure_client, RobotCommandClient.default_service_name)
+                state_future = executor.submit(
+                    self._ensure_client, RobotStateClient.default_service_name)
+                power_future = executor.submit(
+                    self._ensure_client, PowerClient.default_service_name)
+
+                self.lease_client = lease_future.result()
+                self.robot_command_client = command_future.result()
+                self.robot_state_client = state_future.result()
+                self.power_client = power_future.result()
+
+            # Pre-warm the connection with a cheap RPC so the TLS/HTTP2
+            # handshake happens now rather than on the first movement command
+            self.robot_state_client.get_robot_state()
+        except (RpcError, ResponseError) as e:
+            self.logger.error('Failed to setup clients: %s', e)
             return False
+
+        self.logger.info('Clients ready.')
+        return True
     
     def acquire_lease(self):
         """Acquire a lease from the robot (required to send commands).
-        
-        Raises:
-            Exception: If lease acquisition fails
+
+        Returns:
+            bool: True if successful
         """
+        self.logger.info('Acquiring lease...')
         try:
-            self.logger.info('Acquiring lease...')
             self.lease_keepalive = LeaseKeepAlive(
                 self.lease_client, must_acquire=True, return_at_exit=True)
-            self.logger.info('Lease acquired.')
-            return True
-        except Exception as e:
-            self.logger.error(f'Failed to acquire lease: {e}')
+        except (RpcError, ResponseError) as e:
+            self.logger.error('Failed to acquire lease: %s', e)
             return False
+        self.logger.info('Lease acquired.')
+        return True
     
     def release_lease(self):
         """Release the lease if held."""
@@ -153,36 +193,36 @@ class SpotRobotConnection:
     
     def power_on(self, timeout_sec=20):
         """Power on the robot.
-        
+
         Args:
             timeout_sec: Timeout in seconds
-        
-        Raises:
-            Exception: If power on fails
+
+        Returns:
+            bool: True if successful
         """
+        self.logger.info('Powering on robot...')
         try:
-            self.logger.info('Powering on robot...')
             self.robot.power_on(timeout_sec=timeout_sec)
-            self.logger.info('Robot powered on.')
-            return True
-        except Exception as e:
-            self.logger.error(f'Power on failed: {e}')
+        except (RpcError, ResponseError, CommandTimedOutError) as e:
+            self.logger.error('Power on failed: %s', e)
             return False
-    
+        self.logger.info('Robot powered on.')
+        return True
+
     def time_sync(self):
         """Wait for time synchronization with robot.
-        
-        Raises:
-            Exception: If time sync fails
+
+        Returns:
+            bool: True if successful
         """
+        self.logger.info('Syncing time with robot...')
         try:
-            self.logger.info('Syncing time with robot...')
             self.robot.time_sync.wait_for_sync()
-            self.logger.info('Time synchronized.')
-            return True
-        except Exception as e:
-            self.logger.error(f'Time sync failed: {e}')
+        except (RpcError, ResponseError, TimedOutError) as e:
+            self.logger.error('Time sync failed: %s', e)
             return False
+        self.logger.info('Time synchronized.')
+        return True
     
     def disconnect(self):
         """Disconnect from robot and cleanup."""
@@ -8,7 +8,16 @@ import logging
 import math
 import time
 
-from bosdyn.api import geometry_pb2
+import numpy as np
+
+from bosdyn.api import (
+    basic_command_pb2,
+    geometry_pb2,
+    mobility_command_pb2,
+    robot_command_pb2,
+    synchronized_command_pb2,
+    trajectory_pb2,
+)
 from bosdyn.client.frame_helpers import VISION_FRAME_NAME, get_vision_tform_body
 from bosdyn.client.robot_command import (
     RobotCommandBuilder, 
@@ -18,6 +27,89 @@ from bosdyn.client.robot_command import (
 )
 from bosdyn.util import seconds_to_duration
 
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
+
+_LOG = logging.getLogger(__name__)
+
+# Unit square template (counter-clockwise, returning to the start). Computed
+# once at import; a concrete path is just the template scaled by side_length.
+_UNIT_SQUARE = np.array([
+    [0.0, 0.0],
+    [1.0, 0.0],
+    [1.0, 1.0],
+    [0.0, 1.0],
+    [0.0, 0.0],
+])
+
+
+def _compute_trajectory(pts, rotation, translation, seg_time):
+    """Transform body-frame points to the vision frame in a single batch.
+
+    Computes vision-frame positions, successor-facing headings (the final
+    heading is 0), and per-point times with vectorized NumPy operations,
+    so dense paths (arcs, splines, long polygons) stay cheap. When Numba
+    is installed this implementation is replaced by the compiled flat-loop
+    kernel below.
+
+    Args:
+        pts: (N, 2) array of (x, y) points in the body frame
+        rotation: (2, 2) body-to-vision rotation matrix
+        translation: (2,) body-to-vision translation
+        seg_time: Time allotted to each path segment in seconds
+
+    Returns:
+        Tuple of (xs, ys, headings, point_times) NumPy arrays
+    """
+    pts_vision = pts @ rotation.T + translation
+    headings = np.append(
+        np.arctan2(np.diff(pts[:, 1]), np.diff(pts[:, 0])), 0.0)
+    point_times = np.arange(1, pts.shape[0] + 1) * seg_time
+    return pts_vision[:, 0], pts_vision[:, 1], headings, point_times
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _compute_trajectory(pts, rotation, translation, seg_time):
+        """Flat-loop equivalent of the NumPy version, compiled to native code."""
+        n = pts.shape[0]
+        xs = np.empty(n)
+        ys = np.empty(n)
+        headings = np.empty(n)
+        point_times = np.empty(n)
+        for i in range(n):
+            xs[i] = rotation[0, 0] * pts[i, 0] + rotation[0, 1] * pts[i, 1] + translation[0]
+            ys[i] = rotation[1, 0] * pts[i, 0] + rotation[1, 1] * pts[i, 1] + translation[1]
+            point_times[i] = (i + 1) * seg_time
+        for i in range(n - 1):
+            headings[i] = math.atan2(pts[i + 1, 1] - pts[i, 1],
+                                     pts[i + 1, 0] - pts[i, 0])
+        headings[n - 1] = 0.0
+        return xs, ys, headings, point_times
+
+    # Warm the JIT at import so the first walker call doesn't pay compile cost
+    _compute_trajectory(np.zeros((2, 2)), np.eye(2), np.zeros(2), 1.0)
+
+
+def _vision_transform(vision_T_body):
+    """Extract the planar rotation matrix and translation from an SE3Pose.
+
+    Args:
+        vision_T_body: SE3Pose of the body in the vision frame
+
+    Returns:
+        Tuple of (rotation, translation) as (2, 2) and (2,) NumPy arrays
+    """
+    yaw = vision_T_body.rot.to_yaw()
+    rotation = np.array([
+        [math.cos(yaw), -math.sin(yaw)],
+        [math.sin(yaw), math.cos(yaw)],
+    ])
+    translation = np.array([vision_T_body.x, vision_T_body.y])
+    return rotation, translation
+
 
 class SquarePathWalker:
     """Commands Spot to walk in a square pattern."""
@@ -32,8 +124,114 @@ class SquarePathWalker:
         """
         self.command_client = robot_command_client
         self.state_client = robot_state_client
-        self.logger = logger or logging.getLogger(__name__)
-    
+        self.logger = logger or _LOG
+
+        # Cached body pose in the vision frame, refreshed lazily by
+        # _get_vision_tform_body and invalidated whenever the robot moves
+        self._cached_vision_T_body = None
+        self._cache_time = 0.0
+
+        # Wall-clock anchor paired with a monotonic reading; deadlines are
+        # derived from these so a wall-clock jump (NTP, DST) mid-run cannot
+        # hand the robot an already-expired end time
+        self._wall_anchor = time.time()
+        self._mono_anchor = time.monotonic()
+
+    def _deadline(self, seconds_ahead):
+        """Compute an absolute command end time seconds_ahead from now.
+
+        The SDK expects end_time_secs in the local wall-clock domain (it
+        converts to robot time via time-sync), so we return a wall-clock
+        value, but measure elapsed time monotonically against a fixed
+        anchor taken at construction.
+
+        Args:
+            seconds_ahead: How far in the future the deadline should be
+
+        Returns:
+            float: Absolute wall-clock end time in seconds
+        """
+        elapsed = time.monotonic() - self._mono_anchor
+        return self._wall_anchor + elapsed + seconds_ahead
+
+    def _get_vision_tform_body(self, max_age_s=0.5):
+        """Return the robot's pose in the vision frame, cached briefly.
+
+        Fetching the full robot state is a comparatively heavy RPC, so
+        back-to-back trajectory calls reuse a recent snapshot instead of
+        refetching each time.
+
+        Args:
+            max_age_s: Maximum age of the cached pose in seconds
+
+        Returns:
+            SE3Pose of the body in the vision frame
+        """
+        now = time.monotonic()
+        if (self._cached_vision_T_body is None
+                or now - self._cache_time >= max_age_s):
+            robot_state = self.state_client.get_robot_state()
+            self._cached_vision_T_body = get_vision_tform_body(
+                robot_state.kinematic_state.transforms_snapshot)
+            self._cache_time = now
+        return self._cached_vision_T_body
+
+    def _invalidate_pose_cache(self):
+        """Drop the cached body pose (call after the robot has moved)."""
+        self._cached_vision_T_body = None
+
+    @staticmethod
+    def _build_traj_points(xs, ys, headings, point_times):
+        """Package pose and timing arrays into SE2TrajectoryPoint protobufs.
+
+        Args:
+            xs: X coordinates in the vision frame
+            ys: Y coordinates in the vision frame
+            headings: Heading angle at each point
+            point_times: Time since trajectory start for each point
+
+        Returns:
+            list of trajectory_pb2.SE2TrajectoryPoint
+        """
+        return [
+            trajectory_pb2.SE2TrajectoryPoint(
+                pose=geometry_pb2.SE2Pose(
+                    position=geometry_pb2.Vec2(x=xs[idx], y=ys[idx]),
+                    angle=headings[idx]
+                ),
+                time_since_reference=seconds_to_duration(point_times[idx])
+            )
+            for idx in range(len(point_times))
+        ]
+
+    @staticmethod
+    def _build_trajectory_command(trajectory, mobility_params):
+        """Build a synchronized mobility command carrying a full trajectory.
+
+        RobotCommandBuilder.synchro_se2_trajectory_command only accepts a
+        single goal pose, so the multi-point request is assembled directly
+        to keep every waypoint in the command.
+
+        Args:
+            trajectory: trajectory_pb2.SE2Trajectory to follow
+            mobility_params: Mobility params from RobotCommandBuilder
+
+        Returns:
+            robot_command_pb2.RobotCommand
+        """
+        mobility_command = mobility_command_pb2.MobilityCommand.Request(
+            se2_trajectory_request=basic_command_pb2.SE2TrajectoryCommand.Request(
+                trajectory=trajectory,
+                se2_frame_name=VISION_FRAME_NAME
+            ),
+            params=RobotCommandBuilder._to_any(mobility_params)
+        )
+        return robot_command_pb2.RobotCommand(
+            synchronized_command=synchronized_command_pb2.SynchronizedCommand.Request(
+                mobility_command=mobility_command
+            )
+        )
+
     def stand_up(self, timeout_sec=10):
         """Command robot to stand up.
         
@@ -46,10 +244,11 @@ class SquarePathWalker:
         try:
             self.logger.info('Commanding robot to stand...')
             blocking_stand(self.command_client, timeout_sec=timeout_sec)
+            self._invalidate_pose_cache()
             self.logger.info('Robot standing.')
             return True
         except Exception as e:
-            self.logger.error(f'Stand command failed: {e}')
+            self.logger.error('Stand command failed: %s', e)
             return False
     
     def walk_square(self, side_length=1.0, max_velocity=0.5, total_time=20.0):
@@ -67,91 +266,62 @@ class SquarePathWalker:
             bool: True if successful
         """
         try:
-            self.logger.info(f'Writing square path: side={side_length}m, max_vel={max_velocity}m/s')
-            
-            # Get current robot state
-            robot_state = self.state_client.get_robot_state()
+            self.logger.info('Writing square path: side=%sm, max_vel=%sm/s',
+                             side_length, max_velocity)
             
-            # Get robot's current pose in vision frame
-            vision_T_body = get_vision_tform_body(
-                robot_state.kinematic_state.transforms_snapshot)
-            
-            # Define the four corners of a square relative to robot's current position
-            # Starting at (0, 0), we go:
-            # (0, 0) -> (side, 0) -> (side, side) -> (0, side) -> (0, 0)
-            square_points = [
-                (0, 0),                      # Starting position
-                (side_length, 0),            # Right
-                (side_length, side_length),  # Upper right
-                (0, side_length),            # Upper left
-                (0, 0),                      # Back to start
-            ]
+            # Get robot's current pose in vision frame (cached briefly)
+            vision_T_body = self._get_vision_tform_body()
             
+            # Scale the precomputed unit-square template by the side length;
+            # the path starts and ends at the robot's current position
+            square_points = _UNIT_SQUARE * side_length
+
             # Time for each segment (equal time distribution)
             time_per_segment = total_time / len(square_points)
-            
-            # Create trajectory points
-            trajectory_points = []
-            for idx, (x, y) in enumerate(square_points):
-                # Transform point from body frame to vision frame
-                x_vision, y_vision, _ = vision_T_body.transform_point(x, y, 0)
-                
-                # Calculate heading (angle) at this point
-                if idx < len(square_points) - 1:
-                    dx = square_points[idx + 1][0] - square_points[idx][0]
-                    dy = square_points[idx + 1][1] - square_points[idx][1]
-                    heading = math.atan2(dy, dx)
-                else:
-                    heading = 0  # Face forward at end
-                
-                # Create SE2 pose
-                pose = geometry_pb2.SE2Pose(
-                    position=geometry_pb2.Vec2(x=x_vision, y=y_vision),
-                    angle=heading
-                )
-                
-                # Calculate time for this point
-                time_at_point = (idx + 1) * time_per_segment
-                
-                trajectory_points.append((pose, time_at_point))
-                self.logger.debug(f'Point {idx}: x={x_vision:.2f}, y={y_vision:.2f}, '
-                                f'heading={heading:.2f}, time={time_at_point:.2f}s')
-            
-            # Build and send trajectory command
-            # We'll send waypoints one at a time for better control
-            command_id = None
-            for pose, time_val in trajectory_points:
-                mobility_params = RobotCommandBuilder.mobility_params(
-                    max_vel_linear=max_velocity,
-                    max_vel_ang=1.0
-                )
-                
-                cmd = RobotCommandBuilder.synchro_se2_trajectory_point_command(
-                    goal_x=pose.position.x,
-                    goal_y=pose.position.y,
-                    goal_heading=pose.angle,
-                    frame_name=VISION_FRAME_NAME,
-                    params=mobility_params,
-                    body_height=0.0
-                )
-                
-                command_id = self.command_client.robot_command(
-                    cmd, 
-                    end_time_secs=time.time() + time_val
-                )
-                self.logger.info(f'Sent waypoint command (ID: {command_id})')
-                time.sleep(0.1)  # Small delay between waypoint sends
-            
-            # Wait for final command to complete
-            if command_id:
-                self.logger.info('Waiting for robot to reach final waypoint...')
-                block_for_trajectory_cmd(self.command_client, command_id, timeout_sec=total_time + 5)
-                self.logger.info('Square path complete!')
-            
+
+            # Build mobility params once; they are the same for every waypoint
+            mobility_params = RobotCommandBuilder.mobility_params(
+                max_vel_linear=max_velocity,
+                max_vel_ang=1.0
+            )
+
+            # One pass through the (optionally jitted) kernel yields the
+            # vision-frame positions, headings, and per-point times; only
+            # protobuf packaging remains in Python
+            rotation, translation = _vision_transform(vision_T_body)
+            xs_vision, ys_vision, headings, point_times = _compute_trajectory(
+                square_points, rotation, translation, time_per_segment)
+            traj_points = self._build_traj_points(
+                xs_vision, ys_vision, headings, point_times)
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for idx in range(len(point_times)):
+                    self.logger.debug('Point %d: x=%.2f, y=%.2f, heading=%.2f, time=%.2fs',
+                                      idx, xs_vision[idx], ys_vision[idx],
+                                      headings[idx], point_times[idx])
+
+            # Submit the whole square as one trajectory in a single RPC rather
+            # than one waypoint command (plus sleep) per corner
+            trajectory = trajectory_pb2.SE2Trajectory(points=traj_points)
+            cmd = self._build_trajectory_command(trajectory, mobility_params)
+
+            # Submit without blocking on the ack; the future lets local work
+            # overlap the RPC and surfaces any error when reaped
+            command_future = self.command_client.robot_command_async(
+                cmd,
+                end_time_secs=self._deadline(total_time)
+            )
+
+            self.logger.info('Waiting for robot to reach final waypoint...')
+            command_id = command_future.result()
+            block_for_trajectory_cmd(self.command_client, command_id, timeout_sec=total_time + 5)
+            self._invalidate_pose_cache()
+            self.logger.info('Square path complete!')
+
             return True
             
         except Exception as e:
-            self.logger.error(f'Square walk failed: {e}')
+            self.logger.error('Square walk failed: %s', e)
             return False
     
     def walk_square_trajectory(self, side_length=1.0, max_velocity=0.5, total_time=20.0):
@@ -168,49 +338,22 @@ class SquarePathWalker:
             bool: True if successful
         """
         try:
-            self.logger.info(f'Writing square trajectory: side={side_length}m')
+            self.logger.info('Writing square trajectory: side=%sm', side_length)
             
-            # Get current robot state and transform
-            robot_state = self.state_client.get_robot_state()
-            vision_T_body = get_vision_tform_body(
-                robot_state.kinematic_state.transforms_snapshot)
-            
-            # Define square points
-            square_points = [
-                (0, 0),
-                (side_length, 0),
-                (side_length, side_length),
-                (0, side_length),
-                (0, 0),
-            ]
+            # Get robot's current pose in vision frame (cached briefly)
+            vision_T_body = self._get_vision_tform_body()
             
+            # Scale the precomputed unit-square template by the side length
+            square_points = _UNIT_SQUARE * side_length
+
             time_per_segment = total_time / len(square_points)
-            
-            # Create all SE2 trajectory points
-            from bosdyn.api import trajectory_pb2
-            
-            traj_points = []
-            for idx, (x, y) in enumerate(square_points):
-                x_vision, y_vision, _ = vision_T_body.transform_point(x, y, 0)
-                
-                if idx < len(square_points) - 1:
-                    dx = square_points[idx + 1][0] - square_points[idx][0]
-                    dy = square_points[idx + 1][1] - square_points[idx][1]
-                    heading = math.atan2(dy, dx)
-                else:
-                    heading = 0
-                
-                pose = geometry_pb2.SE2Pose(
-                    position=geometry_pb2.Vec2(x=x_vision, y=y_vision),
-                    angle=heading
-                )
-                
-                time_val = (idx + 1) * time_per_segment
-                traj_point = trajectory_pb2.SE2TrajectoryPoint(
-                    pose=pose,
-                    time_since_reference=seconds_to_duration(time_val)
-                )
-                traj_points.append(traj_point)
+
+            # Create all SE2 trajectory points from one kernel pass
+            rotation, translation = _vision_transform(vision_T_body)
+            xs_vision, ys_vision, headings, point_times = _compute_trajectory(
+                square_points, rotation, translation, time_per_segment)
+            traj_points = self._build_traj_points(
+                xs_vision, ys_vision, headings, point_times)
             
             # Create trajectory
             trajectory = trajectory_pb2.SE2Trajectory(points=traj_points)
@@ -221,24 +364,22 @@ class SquarePathWalker:
                 max_vel_ang=1.0
             )
             
-            cmd = RobotCommandBuilder.synchro_se2_trajectory_command(
-                goal_se2=trajectory.points[-1].pose,
-                frame_name=VISION_FRAME_NAME,
-                params=mobility_params
-            )
-            
-            # Send command
-            command_id = self.command_client.robot_command(
+            cmd = self._build_trajectory_command(trajectory, mobility_params)
+
+            # Send command asynchronously; reap the ack via the future
+            command_future = self.command_client.robot_command_async(
                 cmd,
-                end_time_secs=time.time() + total_time
+                end_time_secs=self._deadline(total_time)
             )
+            command_id = command_future.result()
             
             self.logger.info('Square trajectory sent, waiting for completion...')
             block_for_trajectory_cmd(self.command_client, command_id, timeout_sec=total_time + 5)
+            self._invalidate_pose_cache()
             self.logger.info('Square trajectory complete!')
             
             return True
             
         except Exception as e:
-            self.logger.error(f'Square trajectory failed: {e}')
+            self.logger.error('Square trajectory failed: %s', e)
             return False
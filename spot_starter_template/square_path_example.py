@@ -15,6 +15,7 @@ Example:
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from robot_connection import SpotRobotConnection
 from square_movement import SquarePathWalker
@@ -41,34 +42,38 @@ def main(hostname, side_length=1.0, max_velocity=0.5, verbose=False):
     print(f'{"="*60}\n')
     
     robot_conn = SpotRobotConnection(hostname, verbose=verbose)
-    
-    if not robot_conn.connect():
-        return 1
-    
-    # Step 2: Authenticate
-    if not robot_conn.authenticate():
-        return 1
-    
-    # Step 3: Setup clients
-    if not robot_conn.setup_clients():
-        return 1
-    
-    # Step 4: Acquire lease
-    if not robot_conn.acquire_lease():
-        return 1
-    
+
     try:
+        if not robot_conn.connect():
+            return 1
+
+        # Step 2: Authenticate
+        if not robot_conn.authenticate():
+            return 1
+
+        # Step 3: Setup clients
+        if not robot_conn.setup_clients():
+            return 1
+
+        # Step 4: Acquire lease
+        if not robot_conn.acquire_lease():
+            return 1
+
         # Step 5: Verify safety conditions
         if not robot_conn.verify_not_estopped():
             logger.error('Please configure E-Stop before running this example.')
             return 1
         
-        # Step 6: Power on and sync time
-        if not robot_conn.power_on():
-            return 1
-        
-        if not robot_conn.time_sync():
-            return 1
+        # Step 6: Power on and sync time. Neither depends on the other's
+        # result, so run both concurrently and wait for both to finish.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(robot_conn.power_on),
+                executor.submit(robot_conn.time_sync),
+            ]
+            for future in as_completed(futures):
+                if not future.result():
+                    return 1
         
         # Step 7: Stand up
         walker = SquarePathWalker(
@@ -104,7 +109,7 @@ def main(hostname, side_length=1.0, max_velocity=0.5, verbose=False):
         logger.info('Interrupted by user.')
         return 1
     except Exception as e:
-        logger.error(f'Unexpected error: {e}')
+        logger.error('Unexpected error: %s', e)
         return 1
     finally:
         # Always disconnect and cleanup